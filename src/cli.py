@@ -7,7 +7,11 @@ to make data transformation accessible via the terminal.
 """
 
 import ast
+import json
+from pathlib import Path
+
 import click
+
 from .preprocessing import (
     remove_missing_values,
     fill_missing_values,
@@ -17,6 +21,7 @@ from .preprocessing import (
     convert_to_integers,
     logarithmic_transform,
     tokenize_text,
+    tokenize_batch,
     select_alphanumeric,
     remove_stopwords,
     shuffle_list,
@@ -25,6 +30,40 @@ from .preprocessing import (
 )
 
 
+def _parse(values):
+    """Parse a list argument, using C-speed json.loads when the payload allows.
+
+    An argument of the form @path reads the payload from a file first.
+    Python-specific literals (None, single quotes, tuples) fall back to
+    ast.literal_eval.
+    """
+    if values.startswith("@"):
+        values = Path(values[1:]).read_text(encoding="utf-8")
+    stripped = values.lstrip()
+    if stripped.startswith("[") and "'" not in values and "None" not in values:
+        try:
+            return json.loads(values)
+        except ValueError:
+            pass
+    return ast.literal_eval(values)
+
+
+# Shared option so every command can emit machine-readable JSON instead of
+# the default Python repr, letting callers parse output with json.loads.
+_output_format_option = click.option(
+    "--output-format",
+    "output_format",
+    default="repr",
+    type=click.Choice(["repr", "json"]),
+    help="Print the result as Python repr (default) or JSON",
+)
+
+
+def _echo_result(result, output_format):
+    """Echo a command result in the requested output format."""
+    click.echo(json.dumps(result) if output_format == "json" else result)
+
+
 @click.group()
 def cli():
     """Data preprocessing CLI tool."""
@@ -53,32 +92,34 @@ def struct():
 # ========== CLEAN GROUP ==========
 @clean.command()
 @click.argument("values", type=str)
-def remove_missing(values):
+@_output_format_option
+def remove_missing(values, output_format):
     """Remove missing values from list.
 
     Example: python -m src.cli clean remove-missing "[1, None, 2, '', 3]"
     """
     try:
-        parsed_values = ast.literal_eval(values)
+        parsed_values = _parse(values)
     except Exception as e:
         click.echo(f"Error: invalid input syntax ({e})")
         raise click.ClickException("Invalid syntax")
 
     result = remove_missing_values(parsed_values)
-    click.echo(result)
+    _echo_result(result, output_format)
 
 
 @clean.command()
 @click.argument("values", type=str)
 @click.option("--fill-value", default=0, help="Value to fill missing entries")
-def fill_missing(values, fill_value):
+@_output_format_option
+def fill_missing(values, fill_value, output_format):
     """Fill missing values with specified value.
 
     Example: python -m src.cli clean fill-missing "[1, None, 2]" --fill-value 0
     """
-    parsed_values = ast.literal_eval(values)
+    parsed_values = _parse(values)
     result = fill_missing_values(parsed_values, fill_value)
-    click.echo(result)
+    _echo_result(result, output_format)
 
 
 # ========== NUMERIC GROUP ==========
@@ -86,87 +127,113 @@ def fill_missing(values, fill_value):
 @click.argument("values", type=str)
 @click.option("--min-val", default=0.0, help="Minimum value for normalization")
 @click.option("--max-val", default=1.0, help="Maximum value for normalization")
-def normalize(values, min_val, max_val):
+@_output_format_option
+def normalize(values, min_val, max_val, output_format):
     """Normalize numerical values using min-max method.
 
     Example: python -m src.cli numeric normalize "[1, 2, 3, 4, 5]" --min-val 0 --max-val 1
     """
-    parsed_values = ast.literal_eval(values)
+    parsed_values = _parse(values)
     result = normalize_values(parsed_values, min_val, max_val)
-    click.echo(result)
+    _echo_result(result, output_format)
 
 
 @numeric.command()
 @click.argument("values", type=str)
-def standardize(values):
+@_output_format_option
+def standardize(values, output_format):
     """Standardize numerical values using z-score method.
 
     Example: python -m src.cli numeric standardize "[1, 2, 3, 4, 5]"
     """
-    parsed_values = ast.literal_eval(values)
+    parsed_values = _parse(values)
     result = standardize_values(parsed_values)
-    click.echo(result)
+    _echo_result(result, output_format)
 
 
 @numeric.command()
 @click.argument("values", type=str)
 @click.option("--min-val", default=0, help="Minimum value to clip")
 @click.option("--max-val", default=1, help="Maximum value to clip")
-def clip(values, min_val, max_val):
+@_output_format_option
+def clip(values, min_val, max_val, output_format):
     """Clip numerical values to specified range.
 
     Example: python -m src.cli numeric clip "[-1, 0.5, 2, 3]" --min-val 0 --max-val 1
     """
-    parsed_values = ast.literal_eval(values)
+    parsed_values = _parse(values)
     result = clip_values(parsed_values, min_val, max_val)
-    click.echo(result)
+    _echo_result(result, output_format)
 
 
 @numeric.command()
 @click.argument("values", type=str)
-def to_integers(values):
+@_output_format_option
+def to_integers(values, output_format):
     """Convert string values to integers.
 
     Example: python -m src.cli numeric to-integers "['1', '2.5', 'abc', '4']"
     """
-    parsed_values = ast.literal_eval(values)
+    parsed_values = _parse(values)
     result = convert_to_integers(parsed_values)
-    click.echo(result)
+    _echo_result(result, output_format)
 
 
 @numeric.command()
 @click.argument("values", type=str)
-def log_transform(values):
+@_output_format_option
+def log_transform(values, output_format):
     """Transform values to logarithmic scale.
 
     Example: python -m src.cli numeric log-transform "[1, 2, 10, 100]"
     """
-    parsed_values = ast.literal_eval(values)
+    parsed_values = _parse(values)
     result = logarithmic_transform(parsed_values)
-    click.echo(result)
+    _echo_result(result, output_format)
 
 
 # ========== TEXT GROUP ==========
 @text.command()
 @click.argument("input_text", type=str)
-def tokenize(input_text):
+@_output_format_option
+def tokenize(input_text, output_format):
     """Tokenize text into words, keeping alphanumeric characters and lowercasing.
 
     Example: python -m src.cli text tokenize "Hello, World! 123"
     """
     result = tokenize_text(input_text)
-    click.echo(result)
+    _echo_result(result, output_format)
+
+
+@text.command(name="tokenize-batch")
+@click.argument("input_file", type=click.Path(exists=True, dir_okay=False))
+@click.option("--workers", default=None, type=int, help="Number of worker processes")
+@_output_format_option
+def tokenize_batch_cmd(input_file, workers, output_format):
+    """Tokenize each line of a file in parallel.
+
+    Example: python -m src.cli text tokenize-batch corpus.txt --workers 4
+    """
+    with open(input_file, encoding="utf-8") as file:
+        lines = [line.rstrip("\n") for line in file]
+    result = tokenize_batch(lines, workers)
+    if output_format == "json":
+        _echo_result(result, output_format)
+    else:
+        for tokenized in result:
+            click.echo(tokenized)
 
 
 @text.command()
 @click.argument("input_text", type=str)
-def remove_punctuation(input_text):
+@_output_format_option
+def remove_punctuation(input_text, output_format):
     """Remove punctuation, keeping only alphanumeric characters and spaces.
 
     Example: python -m src.cli text remove-punctuation "Hello, World!"
     """
     result = select_alphanumeric(input_text)
-    click.echo(result)
+    _echo_result(result, output_format)
 
 
 @text.command()
@@ -174,7 +241,8 @@ def remove_punctuation(input_text):
 @click.option(
     "--stopwords", default="", help="Comma-separated list of stopwords to remove"
 )
-def remove_stopword(input_text, stopwords):
+@_output_format_option
+def remove_stopword(input_text, stopwords, output_format):
     """Remove stopwords from text.
 
     Example: python -m src.cli text remove-stopwords "this is a test" --stopwords "is,a"
@@ -183,45 +251,49 @@ def remove_stopword(input_text, stopwords):
         [word.strip() for word in stopwords.split(",")] if stopwords else []
     )
     result = remove_stopwords(input_text, stopwords_list)
-    click.echo(result)
+    _echo_result(result, output_format)
 
 
 # ========== STRUCT GROUP ==========
 @struct.command()
 @click.argument("values", type=str)
 @click.option("--seed", default=None, type=int, help="Seed for reproducible shuffling")
-def shuffle(values, seed):
+@_output_format_option
+def shuffle(values, seed, output_format):
     """Shuffle list values randomly.
 
     Example: python -m src.cli struct shuffle "[1, 2, 3, 4, 5]" --seed 42
     """
-    parsed_values = ast.literal_eval(values)
-    result = shuffle_list(parsed_values, seed)
-    click.echo(result)
+    parsed_values = _parse(values)
+    # The parsed list is not reused, so shuffle it in place.
+    result = shuffle_list(parsed_values, seed, copy=False)
+    _echo_result(result, output_format)
 
 
 @struct.command()
 @click.argument("values", type=str)
-def flatten(values):
+@_output_format_option
+def flatten(values, output_format):
     """Flatten a list of lists.
 
     Example: python -m src.cli struct flatten "[[1, 2], [3, 4], [5]]"
     """
-    parsed_values = ast.literal_eval(values)
+    parsed_values = _parse(values)
     result = flatten_list(parsed_values)
-    click.echo(result)
+    _echo_result(result, output_format)
 
 
 @struct.command()
 @click.argument("values", type=str)
-def unique(values):
+@_output_format_option
+def unique(values, output_format):
     """Remove duplicate values from list.
 
     Example: python -m src.cli struct unique "[1, 2, 2, 3, 1]"
     """
-    parsed_values = ast.literal_eval(values)
+    parsed_values = _parse(values)
     result = remove_duplicates(parsed_values)
-    click.echo(result)
+    _echo_result(result, output_format)
 
 
 if __name__ == "__main__": # pragma: no cover
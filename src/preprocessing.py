@@ -5,140 +5,222 @@ This module provides various data preprocessing functions for cleaning, transfor
 and manipulating data of different types (numeric, textual, and structural).
 """
 
-import math
+import os
 import random
 import re
-from typing import List, Any, Optional
+from itertools import chain
+from multiprocessing import Pool
+from typing import Iterator, List, Any, Optional, Union
+
+import numpy as np
+
+from ._kernels import _clip, _log, _normalize, _standardize
+
+# The numeric functions accept either a Python list or an ndarray; ndarray
+# callers get an ndarray back, so chained calls skip the tolist round-trip.
+NumericValues = Union[List[float], np.ndarray]
+
+
+def _aslist_or_array(out: np.ndarray, was_array: bool) -> NumericValues:
+    """Return out unchanged for ndarray callers, else as a Python list."""
+    return out if was_array else out.tolist()
+
+
+# Precompiled text-cleaning patterns, so each call skips the re module's
+# internal cache lookup.
+_ALNUM_RE = re.compile(r"[^a-zA-Z0-9\s]")
+_WS_RE = re.compile(r"\s+")
+
+# Matches integer/decimal/scientific numeric strings, so non-numeric tokens
+# are rejected by a cheap regex branch instead of a raised exception.
+_NUM_RE = re.compile(r"[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?")
+
+# Deletion table covering ASCII characters that are neither alphanumeric nor
+# whitespace; str.translate applies it in a single C pass over the string.
+_KEEP_TABLE = str.maketrans(
+    {c: None for c in map(chr, range(128)) if not (c.isalnum() or c.isspace())}
+)
+
+# Sentinels treated as missing; NaN is caught by the `x != x` idiom below.
+_MISSING = (None, "")
+
+# Elementwise missing-value mask evaluated in a single C loop over the array.
+# The v != v term is the NaN idiom, not a redundant self-comparison.
+# pylint: disable-next=comparison-with-itself
+_missing_mask = np.frompyfunc(lambda v: v in _MISSING or v != v, 1, 1)
+
+
+def _as_object_array(values: List[Any]) -> np.ndarray:
+    """Build a 1-D object array, keeping sequence elements as single objects."""
+    arr = np.empty(len(values), dtype=object)
+    arr[:] = values
+    return arr
 
 
 def remove_missing_values(values: List[Any]) -> List[Any]:
     """Remove None, '', and nan values from list."""
-    result = []
-    for value in values:
-        if (
-            value is not None
-            and value != ""
-            and not (isinstance(value, float) and math.isnan(value))
-        ):
-            result.append(value)
-    return result
+    if not values:
+        return []
+    arr = _as_object_array(values)
+    return arr[~_missing_mask(arr).astype(bool)].tolist()
 
 
 def fill_missing_values(values: List[Any], fill_value: Any = 0) -> List[Any]:
     """Fill missing values with specified value."""
-    result = []
-    for value in values:
-        if (
-            value is None
-            or value == ""
-            or (isinstance(value, float) and math.isnan(value))
-        ):
-            result.append(fill_value)
-        else:
-            result.append(value)
-    return result
+    if not values:
+        return []
+    arr = _as_object_array(values)
+    # Box the fill value so a sequence is inserted as one object, not broadcast.
+    box = np.empty(1, dtype=object)
+    box[0] = fill_value
+    return np.where(_missing_mask(arr).astype(bool), box, arr).tolist()
 
 
 def remove_duplicates(values: List[Any]) -> List[Any]:
     """Remove duplicate values while preserving order."""
-    seen = set()
-    result = []
-    for value in values:
-        if value not in seen:
-            seen.add(value)
-            result.append(value)
-    return result
+    # dicts preserve insertion order, so this deduplicates in one C pass.
+    return list(dict.fromkeys(values))
 
 
 def normalize_values(
-    values: List[float], new_min: float = 0.0, new_max: float = 1.0
-) -> List[float]:
+    values: NumericValues, new_min: float = 0.0, new_max: float = 1.0
+) -> NumericValues:
     """Normalize values using min-max scaling."""
-    if not values:
-        return []
-
-    old_min = min(values)
-    old_max = max(values)
+    was_array = isinstance(values, np.ndarray)
+    if len(values) == 0:
+        return values if was_array else []
 
-    if old_max == old_min:
-        return [new_min] * len(values)
+    arr = np.asarray(values, dtype=np.float64)
+    return _aslist_or_array(_normalize(arr, new_min, new_max), was_array)
 
-    return [
-        (new_min + (x - old_min) * (new_max - new_min) / (old_max - old_min))
-        for x in values
-    ]
 
-
-def standardize_values(values: List[float]) -> List[float]:
+def standardize_values(values: NumericValues) -> NumericValues:
     """Standardize values using z-score method."""
-    if not values:
-        return []
-
-    mean_val = sum(values) / len(values)
-    variance = sum((x - mean_val) ** 2 for x in values) / len(values)
-    std_dev = math.sqrt(variance)
+    was_array = isinstance(values, np.ndarray)
+    if len(values) == 0:
+        return values if was_array else []
 
-    if std_dev == 0:
-        return [0.0] * len(values)
+    arr = np.asarray(values, dtype=np.float64)
+    return _aslist_or_array(_standardize(arr), was_array)
 
-    return [(x - mean_val) / std_dev for x in values]
 
+def clip_values(values: NumericValues, min_val: float, max_val: float) -> NumericValues:
+    """Clip values to specified range.
 
-def clip_values(values: List[float], min_val: float, max_val: float) -> List[float]:
-    """Clip values to specified range."""
-    return [max(min_val, min(max_val, x)) for x in values]
+    Note: NaN values propagate unchanged, as with np.clip.
+    """
+    was_array = isinstance(values, np.ndarray)
+    arr = np.asanyarray(values)
+    # Integer inputs with integer bounds use the kernel's int64 specialization
+    # and skip the float round-trip; everything else goes through float64.
+    int_path = (
+        arr.dtype.kind in "iu" and isinstance(min_val, int) and isinstance(max_val, int)
+    )
+    if not int_path and arr.dtype != np.float64:
+        arr = arr.astype(np.float64)
+    return _aslist_or_array(_clip(arr, min_val, max_val), was_array)
 
 
 def convert_to_integers(values: List[str]) -> List[int]:
     """Convert string values to integers, excluding non-numerical values."""
     result = []
     for value in values:
-        try:
-            result.append(int(float(value)))
-        except (ValueError, TypeError):
-            continue
+        if isinstance(value, str):
+            if _NUM_RE.fullmatch(value.strip()):
+                result.append(int(float(value)))
+        # value == value excludes NaN, the same idiom as _missing_mask above.
+        # pylint: disable-next=comparison-with-itself
+        elif isinstance(value, (int, float)) and value == value:
+            result.append(int(value))
     return result
 
 
-def logarithmic_transform(values: List[float]) -> List[float]:
+def logarithmic_transform(values: NumericValues) -> NumericValues:
     """Transform positive values to logarithmic scale."""
-    return [math.log(x) for x in values if x > 0]
+    was_array = isinstance(values, np.ndarray)
+    out = _log(np.asarray(values, dtype=np.float64))
+    return _aslist_or_array(out, was_array)
 
 
 def tokenize_text(text: str) -> str:
     """Tokenize text into words, keeping only alphanumeric characters and lowercasing."""
     # Keep only alphanumeric characters and spaces
-    cleaned = re.sub(r"[^a-zA-Z0-9\s]", "", text)
+    cleaned = select_alphanumeric(text)
     # Convert to lowercase and normalize whitespace
-    return " ".join(cleaned.lower().split())
+    return _WS_RE.sub(" ", cleaned.lower()).strip()
 
 
 def select_alphanumeric(text: str) -> str:
     """Select only alphanumeric characters and spaces."""
-    return re.sub(r"[^a-zA-Z0-9\s]", "", text)
+    if text.isascii():
+        return text.translate(_KEEP_TABLE)
+    # Non-ASCII characters are outside the translation table; keep the
+    # regex path so they are still stripped.
+    return _ALNUM_RE.sub("", text)
+
+
+def tokenize_batch(texts: List[str], workers: Optional[int] = None) -> List[str]:
+    """Tokenize a batch of texts in parallel, one worker process per chunk."""
+    if not texts:
+        return []
+
+    n_workers = workers or os.cpu_count() or 1
+    if n_workers == 1 or len(texts) < n_workers:
+        return [tokenize_text(text) for text in texts]
+
+    chunksize = max(1, len(texts) // (4 * n_workers))
+    with Pool(n_workers) as pool:
+        return pool.map(tokenize_text, texts, chunksize=chunksize)
+
+
+def tokenize_stream(path: str, chunk_bytes: int = 1 << 20) -> Iterator[str]:
+    """Yield tokens from a text file lazily, reading fixed-size chunks.
+
+    A word split across a chunk boundary is carried over and prepended to
+    the next chunk, so tokens come out whole while memory use stays flat
+    regardless of file size.
+    """
+    carry = ""
+    with open(path, encoding="utf-8", buffering=chunk_bytes) as file:
+        while True:
+            chunk = file.read(chunk_bytes)
+            if not chunk:
+                break
+            words = (carry + chunk).split()
+            # If the chunk ends mid-word, hold the tail back for the next read.
+            carry = words.pop() if words and not chunk[-1].isspace() else ""
+            for word in words:
+                token = tokenize_text(word)
+                if token:
+                    yield token
+    if carry:
+        token = tokenize_text(carry)
+        if token:
+            yield token
 
 
 def remove_stopwords(text: str, stopwords: List[str]) -> str:
     """Remove stop words from lowercased text."""
-    words = text.lower().split()
-    filtered_words = [
-        word for word in words if word not in [sw.lower() for sw in stopwords]
-    ]
-    return " ".join(filtered_words)
+    stopword_set = frozenset(sw.lower() for sw in stopwords)
+    return " ".join(word for word in text.lower().split() if word not in stopword_set)
 
 
 def flatten_list(nested_list: List[List[Any]]) -> List[Any]:
     """Flatten a list of lists."""
-    result = []
-    for sublist in nested_list:
-        result.extend(sublist)
-    return result
-
-
-def shuffle_list(values: List[Any], seed: Optional[int] = None) -> List[Any]:
-    """Randomly shuffle list values with optional seed."""
-    result = values.copy()
-    if seed is not None:
-        random.seed(seed)
-    random.shuffle(result)
+    return list(chain.from_iterable(nested_list))
+
+
+def shuffle_list(
+    values: List[Any], seed: Optional[int] = None, copy: bool = True
+) -> List[Any]:
+    """Randomly shuffle list values with optional seed.
+
+    With copy=False the input list is shuffled in place and returned,
+    avoiding a second N-element allocation when the caller discards the
+    original order anyway.
+    """
+    result = values[:] if copy else values
+    # A local Random instance keeps seeding from mutating the module-global RNG.
+    rng = random.Random(seed) if seed is not None else random
+    rng.shuffle(result)
     return result
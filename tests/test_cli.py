@@ -1,7 +1,7 @@
 """Integration tests for CLI commands using pytest and Click's CliRunner."""
 # pylint: disable=redefined-outer-name
 
-import ast
+import json
 import pytest
 from click.testing import CliRunner
 from src.cli import cli as cli_group
@@ -12,14 +12,10 @@ def runner():
     return CliRunner()
 
 def run_and_parse(runner, argv):
-    """Helper to run CLI and parse python-like output."""
-    result = runner.invoke(cli_group, argv)
+    """Helper to run CLI in JSON output mode and parse the result."""
+    result = runner.invoke(cli_group, argv + ['--output-format', 'json'])
     assert result.exit_code == 0, f"CLI failed: {result.output}"
-    output = result.output.strip()
-    try:
-        return ast.literal_eval(output)
-    except (ValueError, SyntaxError):
-        return output
+    return json.loads(result.output.strip())
 
 # ========== CLEAN GROUP TESTS ==========
 def test_cli_remove_missing(runner):
@@ -40,6 +36,13 @@ def test_cli_fill_missing_default(runner):
     parsed = run_and_parse(runner, argv)
     assert parsed == [0, 0, 5]
 
+def test_cli_values_from_file(runner, tmp_path):
+    """Test reading the values payload from a file via @path."""
+    payload = tmp_path / "values.txt"
+    payload.write_text("[1, 2, 2, 3, 1]", encoding="utf-8")
+    parsed = run_and_parse(runner, ['struct', 'unique', f"@{payload}"])
+    assert parsed == [1, 2, 3]
+
 # ========== NUMERIC GROUP TESTS ==========
 def test_cli_numeric_normalize_with_options(runner):
     """Test CLI normalize with custom min/max options."""
@@ -89,6 +92,14 @@ def test_cli_text_tokenize(runner):
     parsed = run_and_parse(runner, argv)
     assert parsed == "hello world 123"
 
+def test_cli_text_tokenize_batch(runner, tmp_path):
+    """Test CLI batch tokenize command on a file of lines."""
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text("Hello, World!\nFoo... BAR\n", encoding="utf-8")
+    result = runner.invoke(cli_group, ['text', 'tokenize-batch', str(corpus)])
+    assert result.exit_code == 0
+    assert result.output.splitlines() == ["hello world", "foo bar"]
+
 def test_cli_text_remove_punctuation(runner):
     """Test CLI remove punctuation command."""
     argv = ['text', 'remove-punctuation', "Hello, World!"]
@@ -4,6 +4,7 @@
 import math
 from typing import List
 
+import numpy as np
 import pytest
 
 from src.preprocessing import (
@@ -16,6 +17,8 @@ from src.preprocessing import (
     convert_to_integers,
     logarithmic_transform,
     tokenize_text,
+    tokenize_batch,
+    tokenize_stream,
     select_alphanumeric,
     remove_stopwords,
     flatten_list,
@@ -48,6 +51,16 @@ def test_remove_missing_values_parametrized(input_values, expected):
     result = remove_missing_values(input_values)
     assert result == expected
 
+def test_remove_missing_values_keeps_sequence_elements():
+    """Sequence elements must survive intact, not be flattened elementwise."""
+    values = [[1, 2], None, [3, 4], '']
+    assert remove_missing_values(values) == [[1, 2], [3, 4]]
+
+def test_fill_missing_values_sequence_elements():
+    """Sequence elements and sequence fill values are treated as single objects."""
+    assert fill_missing_values([None, 1], fill_value=[9, 9]) == [[9, 9], 1]
+    assert fill_missing_values([[1, None], [3, 4]], 0) == [[1, None], [3, 4]]
+
 @pytest.mark.parametrize(
     "values",
     [
@@ -126,6 +139,28 @@ def test_clip_values():
     clipped = clip_values(values, min_val=0, max_val=2)
     assert clipped == [0, 0.5, 2, 2]
 
+def test_numeric_functions_ndarray_passthrough(sample_numbers):
+    """ndarray inputs should come back as ndarrays, matching the list path."""
+    arr = np.asarray(sample_numbers)
+    chained = clip_values(normalize_values(standardize_values(arr)), 0.0, 1.0)
+    assert isinstance(chained, np.ndarray)
+    expected = clip_values(
+        normalize_values(standardize_values(sample_numbers)), 0.0, 1.0
+    )
+    assert chained.tolist() == pytest.approx(expected)
+
+def test_clip_values_nan_propagates():
+    """NaN values pass through the clip unchanged, as documented."""
+    result = clip_values([float("nan"), 0.5], 0.0, 1.0)
+    assert math.isnan(result[0])
+    assert result[1] == 0.5
+
+def test_clip_values_integer_inputs():
+    """Integer inputs with integer bounds should stay integers."""
+    clipped = clip_values([-5, 0, 2, 10], min_val=0, max_val=8)
+    assert clipped == [0, 0, 2, 8]
+    assert all(isinstance(x, int) for x in clipped)
+
 def test_convert_to_integers():
     """Test convert_to_integers function."""
     values = ['1', '2.5', 'abc', None, '4']
@@ -152,6 +187,24 @@ def test_text_processing_tokenize_and_select():
     assert tok == "hello world 123"
     assert sel == "Hello WORLD 123"
 
+def test_tokenize_batch_matches_tokenize_text():
+    """Batch tokenization should match per-text tokenization, in order."""
+    texts = ["Hello, WORLD!", "Foo... bar?", "", "123 abc!"]
+    assert tokenize_batch(texts, workers=2) == [tokenize_text(t) for t in texts]
+
+def test_tokenize_batch_empty():
+    """Batch tokenization of an empty batch returns an empty list."""
+    assert tokenize_batch([]) == []
+
+def test_tokenize_stream_stitches_chunk_boundaries(tmp_path):
+    """Streaming tokenization should match whole-file tokenization."""
+    text = "Hello, World! This is a LONGER sentence, with 123 numbers."
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text(text, encoding="utf-8")
+    # A tiny chunk size forces words to be split across chunk boundaries.
+    streamed = list(tokenize_stream(str(corpus), chunk_bytes=7))
+    assert streamed == tokenize_text(text).split()
+
 def test_remove_stopwords_lowercased():
     """Test remove_stopwords function."""
     text = "This is a Test of stopwords"
@@ -174,6 +227,16 @@ def test_shuffle_list_reproducible():
     # ensure it's a permutation of original
     assert sorted(s1) == sorted(values)
 
+def test_shuffle_list_copy_flag():
+    """With copy=False the input list is shuffled in place."""
+    values = [1, 2, 3, 4, 5]
+    result = shuffle_list(values, seed=42, copy=False)
+    assert result is values
+    # Default keeps the input untouched.
+    original = [1, 2, 3, 4, 5]
+    shuffle_list(original, seed=42)
+    assert original == [1, 2, 3, 4, 5]
+
 def test_normalize_edge_cases(sample_numbers):
     """Test normalization edge cases using fixture."""
     # Single value